@@ -1,9 +1,4 @@
 import streamlit as st
-import os
-import sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from my_utils import load_excel
 
 #Sidebar Dataset Selector
 st.sidebar.title("📁 Select Dataset")
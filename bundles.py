@@ -0,0 +1,176 @@
+import datetime
+import json
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from my_utils import BASE_DIR, comparison_table, login_counts
+from risk import score_risk, student_records
+
+
+EXPORT_DIR = BASE_DIR / "exports"
+BUNDLE_FORMATS = ("parquet", "csv")
+CHUNK_ROWS = 50_000
+MANIFEST = "manifest.json"
+# Opened bundles kept in memory; the least recently opened is evicted.
+BUNDLE_CACHE_ENTRIES = 4
+
+
+def student_totals(df, scored):
+    """
+    Return one row per student with totals over the whole term.
+
+    Students sharing an ID get one row each, told apart by Record.
+    """
+    keys = ['Student_ID', 'Record']
+    by_student = scored.groupby(keys)
+    totals = pd.DataFrame({
+        "Overall Result": by_student["Overall Result"].first(),
+        "Performance_Band": by_student["Performance_Band"].first(),
+        "Total_Hours": by_student["Weekly_Hours"].sum(),
+        "Weeks_Active": (scored["Weekly_Hours"] > 0).groupby([scored[key] for key in keys]).sum(),
+        "Weeks_At_Risk": by_student["At_Risk"].sum(),
+        "Logins": login_counts(df, by=[df['Student_ID'], student_records(df).rename('Record')]),
+    })
+    return totals.rename_axis(keys).reset_index()
+
+def analytics_tables(df, comparison=None):
+    """
+    Yield (name, frame) for each exported table, building one at a time.
+
+    comparison: optional (group_df, individual_df) pair for the cross-dataset
+    table. A 'Cluster' column (as added by Clustering.ipynb) is exported
+    as the clusters table when present.
+    """
+    scored = score_risk(df)
+    yield "student_totals", student_totals(df, scored)
+    yield "trajectory", scored[['Student_ID', 'Record', 'Week', 'Week_Num', 'Weekly_Hours', 'Cumulative_Hours', 'Hours_Trend']]
+
+    flag_cols = [col for col in scored.columns if scored[col].dtype == bool] + ['Risk_Score', 'Risk_Level']
+    yield "risk_flags", scored[['Student_ID', 'Record', 'Week_Num'] + flag_cols]
+    del scored
+
+    if comparison is not None:
+        yield "comparison", comparison_table(*comparison).rename_axis('Student_ID').reset_index()
+    if 'Cluster' in df.columns:
+        yield "clusters", df[[col for col in ['Student_ID', 'Week', 'Cluster', 'PCA1', 'PCA2'] if col in df.columns]]
+
+def _write_parquet(frame, path, chunk_rows):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(frame.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, len(frame), chunk_rows):
+            chunk = frame.iloc[start:start + chunk_rows]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+def _write_csv(frame, path, chunk_rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        frame.iloc[:0].to_csv(f, index=False)
+        for start in range(0, len(frame), chunk_rows):
+            frame.iloc[start:start + chunk_rows].to_csv(f, header=False, index=False)
+
+def write_bundle(tables, bundle_dir, fmt="parquet", chunk_rows=CHUNK_ROWS, source=None):
+    """
+    Stream (name, frame) tables to bundle_dir in row chunks and return the manifest.
+
+    Each table becomes <name>.parquet or <name>.csv; manifest.json lists the
+    tables, their row counts and the source dataset.
+    """
+    if fmt not in BUNDLE_FORMATS:
+        raise ValueError(f"Unknown bundle format: {fmt}")
+
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    write = _write_parquet if fmt == "parquet" else _write_csv
+
+    manifest = {
+        "format": fmt,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "source": source or {},
+        "tables": {},
+    }
+    for name, frame in tables:
+        file_name = f"{name}.{fmt}"
+        write(frame, bundle_dir / file_name, chunk_rows)
+        manifest["tables"][name] = {"file": file_name, "rows": len(frame), "columns": list(frame.columns)}
+
+    (bundle_dir / MANIFEST).write_text(json.dumps(manifest, indent=1))
+    return manifest
+
+def zip_bundle(tables, fmt="parquet", chunk_rows=CHUNK_ROWS, source=None):
+    """
+    Write a bundle to a temporary directory and return it zipped, as bytes.
+
+    The tables are still written to disk chunk by chunk, but the finished
+    archive is returned in memory: st.download_button reads whatever its
+    callable returns into bytes and keeps them for the download anyway.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix="bundle-"))
+    try:
+        write_bundle(tables, work_dir / "bundle", fmt, chunk_rows, source)
+        archive_path = work_dir / "bundle.zip"
+        # Parquet is already compressed; CSV benefits from deflate.
+        compression = zipfile.ZIP_STORED if fmt == "parquet" else zipfile.ZIP_DEFLATED
+        with zipfile.ZipFile(archive_path, "w", compression) as zf:
+            for path in sorted((work_dir / "bundle").iterdir()):
+                zf.write(path, path.name)
+        return archive_path.read_bytes()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def list_bundles(export_dir=EXPORT_DIR):
+    """
+    Return bundle directories under export_dir, newest first.
+    """
+    if not Path(export_dir).is_dir():
+        return []
+    bundles = [path.parent for path in Path(export_dir).glob(f"*/{MANIFEST}")]
+    return sorted(bundles, key=lambda path: path.stat().st_mtime, reverse=True)
+
+def load_bundle(source):
+    """
+    Open a bundle directory or zip archive (path or file-like).
+
+    Returns (manifest, {table name: DataFrame}).
+    """
+    if isinstance(source, (str, Path)) and Path(source).is_dir():
+        root = Path(source)
+        manifest = json.loads((root / MANIFEST).read_text())
+        return manifest, {
+            name: _read_table(root / info["file"], manifest["format"])
+            for name, info in manifest["tables"].items()
+        }
+
+    with zipfile.ZipFile(source) as archive:
+        manifest = json.loads(archive.read(MANIFEST))
+        tables = {}
+        for name, info in manifest["tables"].items():
+            with archive.open(info["file"]) as handle:
+                tables[name] = _read_table(handle, manifest["format"])
+    return manifest, tables
+
+def _read_table(handle, fmt):
+    return pd.read_parquet(handle) if fmt == "parquet" else pd.read_csv(handle)
+
+@st.cache_resource(show_spinner="Opening bundle...", max_entries=BUNDLE_CACHE_ENTRIES)
+def open_saved_bundle(bundle_dir, mtime_ns=None):
+    """
+    Load a saved bundle once and share it read-only across sessions.
+    """
+    return load_bundle(bundle_dir)
+
+@st.cache_resource(show_spinner="Opening bundle...", max_entries=BUNDLE_CACHE_ENTRIES)
+def open_uploaded_bundle(file_id, _upload):
+    """
+    Parse an uploaded bundle once per upload rather than on every rerun.
+
+    Keyed on the upload's file_id; the file itself is not hashed.
+    """
+    _upload.seek(0)
+    return load_bundle(_upload)
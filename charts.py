@@ -0,0 +1,141 @@
+import functools
+
+import streamlit as st
+
+
+# Plotly figure specs shared by the dashboard pages.
+#
+# Every builder returns a plain Plotly dict that st.plotly_chart renders
+# directly, so no figure objects outlive a rerun and the specs themselves can
+# be memoised with st.cache_data.
+#
+# Specs are built from per-student and per-threshold inputs, so the memo is
+# bounded: past SPEC_CACHE_ENTRIES per builder the least recently used spec
+# is evicted, and every spec expires after SPEC_CACHE_TTL.
+SPEC_CACHE_ENTRIES = 64
+SPEC_CACHE_TTL = "1h"
+
+
+def _freeze(value):
+    # Series, Index and arrays become plain tuples so st.cache_data can hash
+    # them and the resulting spec holds only native Python values.
+    if hasattr(value, "tolist"):
+        return tuple(value.tolist())
+    return value
+
+
+def _cached_spec(builder):
+    cached = st.cache_data(show_spinner=False, max_entries=SPEC_CACHE_ENTRIES, ttl=SPEC_CACHE_TTL)(builder)
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        return cached(*map(_freeze, args), **{k: _freeze(v) for k, v in kwargs.items()})
+
+    return wrapper
+
+
+def _layout(title=None, x_title=None, y_title=None, **extra):
+    layout = {"title": {"text": title}, "xaxis": {"title": {"text": x_title}}, "yaxis": {"title": {"text": y_title}}}
+    for key, value in extra.items():
+        # Plotly-style shorthands such as xaxis_tickangle or title_x.
+        parent, _, child = key.partition("_")
+        if child and isinstance(layout.get(parent), dict):
+            layout[parent][child] = value
+        elif value is not None:
+            layout[key] = value
+    return layout
+
+
+@_cached_spec
+def bar_spec(x, y, title=None, x_title=None, y_title=None, color=None, text=False, **layout):
+    """
+    Return a single-series bar chart spec.
+    """
+    trace = {"type": "bar", "x": list(x), "y": list(y)}
+    if color:
+        trace["marker"] = {"color": color}
+    if text:
+        trace["text"] = list(y)
+        trace["texttemplate"] = "%{text:.2f}"
+    return {"data": [trace], "layout": _layout(title, x_title, y_title, **layout)}
+
+
+@_cached_spec
+def line_spec(x, y, title=None, x_title=None, y_title=None, markers=False, fill=False, **layout):
+    """
+    Return a single-series line (or filled area) chart spec.
+    """
+    trace = {"type": "scatter", "x": list(x), "y": list(y), "mode": "lines+markers" if markers else "lines"}
+    if fill:
+        trace["fill"] = "tozeroy"
+    return {"data": [trace], "layout": _layout(title, x_title, y_title, **layout)}
+
+
+@_cached_spec
+def pie_spec(values, names, hole=0.0, title=None):
+    """
+    Return a pie (or donut, when hole > 0) chart spec.
+    """
+    trace = {"type": "pie", "values": list(values), "labels": [str(n) for n in names], "hole": hole}
+    return {"data": [trace], "layout": {"title": {"text": title}}}
+
+
+@_cached_spec
+def histogram_spec(x, nbins=None, groups=None, colors=None, title=None, x_title=None, y_title="Count", **layout):
+    """
+    Return a histogram spec, optionally overlaid by group.
+
+    groups: sequence aligned with x; one trace is drawn per distinct value.
+    colors: optional mapping of group value to colour.
+    """
+    x = list(x)
+    if groups is None:
+        series = [(None, x)]
+    else:
+        groups = list(groups)
+        series = [(g, [v for v, k in zip(x, groups) if k == g]) for g in dict.fromkeys(groups)]
+
+    traces = []
+    for name, values in series:
+        trace = {"type": "histogram", "x": values}
+        if nbins:
+            trace["nbinsx"] = nbins
+        if name is not None:
+            trace["name"] = str(name)
+            trace["opacity"] = 0.6
+            if colors and name in colors:
+                trace["marker"] = {"color": colors[name]}
+        traces.append(trace)
+
+    barmode = "overlay" if groups is not None else None
+    return {"data": traces, "layout": _layout(title, x_title, y_title, barmode=barmode, **layout)}
+
+
+@_cached_spec
+def scatter_spec(x, y, groups, hover=None, colors=None, title=None, x_title=None, y_title=None, legend_title=None, marker=None, **layout):
+    """
+    Return a scatter spec with one coloured trace per group.
+    """
+    x, y, groups = list(x), list(y), list(groups)
+    hover = list(hover) if hover is not None else None
+
+    traces = []
+    for name in dict.fromkeys(groups):
+        rows = [i for i, g in enumerate(groups) if g == name]
+        trace = {
+            "type": "scatter",
+            "mode": "markers",
+            "name": str(name),
+            "x": [x[i] for i in rows],
+            "y": [y[i] for i in rows],
+            "marker": dict(marker or {}),
+        }
+        if colors and name in colors:
+            trace["marker"]["color"] = colors[name]
+        if hover is not None:
+            trace["hovertext"] = [hover[i] for i in rows]
+        traces.append(trace)
+
+    extra = {"legend": {"title": {"text": legend_title}}} if legend_title else {}
+    extra.update(layout)
+    return {"data": traces, "layout": _layout(title, x_title, y_title, **extra)}
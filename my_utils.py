@@ -1,31 +1,310 @@
+import datetime
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
 import pandas as pd
+import streamlit as st
 from pathlib import Path
 
 
-def load_excel(file_path):
+def read_sheets(file_path):
     """
-    Load an Excel file and return all sheets combined with a 'Week' column.
+    Return every sheet of an Excel file as {sheet name: DataFrame}.
     """
     xls = pd.ExcelFile(file_path)
+    return {sheet: xls.parse(sheet) for sheet in xls.sheet_names}
+
+def combine_sheets(sheets):
+    """
+    Return the sheets combined with a 'Week' column, and the sheet names.
+    """
     all_data = pd.concat(
-        [xls.parse(sheet).assign(Week=sheet) for sheet in xls.sheet_names],
+        [frame.assign(Week=sheet) for sheet, frame in sheets.items()],
         ignore_index=True
     )
-    return all_data, xls.sheet_names
+    return all_data, list(sheets)
 
-def get_dataset_by_selection(selection):
+def load_excel(file_path):
     """
-    Return dataset and sheet names based on sidebar selection.
+    Load an Excel file and return all sheets combined with a 'Week' column.
     """
-    from pathlib import Path
+    return combine_sheets(read_sheets(file_path))
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
+QUALITY_DIR = DATA_DIR / ".quality"
+CACHE_DIR = DATA_DIR / ".cache"
+
+DATASETS = {
+    "Group Based Engagement": DATA_DIR / "cleaned_Newdata01.xlsx",
+    "Individual Based Engagement": DATA_DIR / "cleaned_new2_revised_2.xlsx",
+}
+
+# Daily activity columns; the first carries the question text, the rest are day names.
+DAY_COLUMNS = [
+    "Student Activity by Day in hours Monday", "Tuesday", "Wednesday", "Thursday",
+    "Friday", "Saturday", "Sunday"
+]
+
+BIRTH_YEAR_COL = "Q14 What is your year of birth (Just the year, e.g. 1995) ?"
+AGE_RANGE = (18, 100)
+OUTLIER_QUANTILES = (0.01, 0.99)
+SPECIAL_CHARS = r"[^a-zA-Z0-9\s]"
+# Bumped when the report's contents change, so stored reports are rebuilt.
+QUALITY_REPORT_VERSION = 2
+# Bumped when clean_dataset() changes, so cached cleaned frames are rebuilt.
+CLEANING_VERSION = 1
+
+def file_hash(file_path):
+    """
+    Return the SHA-256 hex digest of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def clean_dataset(df):
+    """
+    Apply the cleaning the pages used to repeat on every rerun.
+
+    Strips column names and text values, and derives an 'Age' column from
+    the birth year (NaN outside AGE_RANGE).
+    """
+    df.columns = df.columns.str.strip()
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        # Non-string cells (e.g. timestamps in Initial_* columns) strip to NaN; keep them.
+        df[col] = df[col].str.strip().fillna(df[col])
+
+    if BIRTH_YEAR_COL in df.columns:
+        age = datetime.datetime.now().year - pd.to_numeric(df[BIRTH_YEAR_COL], errors="coerce")
+        df["Age"] = age.where(age.between(*AGE_RANGE))
+    return df
+
+def quality_report(df):
+    """
+    Return a per-column data-quality table for a (raw) dataset.
+
+    Columns: dtype, nulls, null_pct, whitespace and special_chars (text cells
+    affected) and outliers (numeric cells outside OUTLIER_QUANTILES).
+    """
+    report = pd.DataFrame(index=df.columns)
+    report["dtype"] = df.dtypes.astype(str)
+    report["nulls"] = df.isna().sum()
+    report["null_pct"] = (report["nulls"] / max(len(df), 1) * 100).round(2)
+
+    # All text cells in one Series, so each check is a single vectorised pass.
+    text = df.select_dtypes(include=["object", "string"]).stack().astype(object)
+    text_col = text.index.get_level_values(1)
+    report["whitespace"] = text.str.contains(r"^\s|\s$", na=False).groupby(text_col).sum()
+    report["special_chars"] = text.str.contains(SPECIAL_CHARS, na=False).groupby(text_col).sum()
+
+    numeric = df.select_dtypes(include="number").drop(columns="Student_ID", errors="ignore")
+    low, high = numeric.quantile(list(OUTLIER_QUANTILES)).to_numpy()
+    report["outliers"] = ((numeric < low) | (numeric > high)).sum()
+
+    counts = ["whitespace", "special_chars", "outliers"]
+    report[counts] = report[counts].fillna(0).astype(int)
+    return report.rename_axis("column").reset_index()
+
+def sheet_quality_report(sheets):
+    """
+    Return quality_report() over {sheet name: DataFrame}, combined per column.
+
+    Each column is only checked in the sheets that contain it, so a column
+    present in one week is not reported as null in all the others.
+    The 'sheets' column counts the sheets a column appears in.
+    """
+    reports = pd.concat(
+        [quality_report(frame).assign(rows=len(frame)) for frame in sheets.values()],
+        ignore_index=True
+    )
+    report = reports.groupby("column", sort=False).agg(
+        dtype=("dtype", lambda dtypes: " / ".join(dict.fromkeys(dtypes))),
+        sheets=("rows", "size"),
+        rows=("rows", "sum"),
+        nulls=("nulls", "sum"),
+        whitespace=("whitespace", "sum"),
+        special_chars=("special_chars", "sum"),
+        outliers=("outliers", "sum"),
+    )
+    report.insert(4, "null_pct", (report["nulls"] / report["rows"].clip(lower=1) * 100).round(2))
+    return report.drop(columns="rows").reset_index()
+
+def duplicate_columns(columns):
+    """
+    Return columns pandas de-duplicated on load ('X.1' where 'X' also exists).
+    """
+    names = set(columns)
+    return [col for col in columns if re.fullmatch(r".+\.\d+", col) and col.rsplit(".", 1)[0] in names]
+
+@st.cache_data(show_spinner="Loading dataset...")
+def load_dataset(file_path, mtime_ns=None):
+    """
+    Ingest an Excel dataset once per file version.
+
+    Returns the cleaned frame, its sheet names and the quality report, which
+    is also stored as JSON under data/.quality/ keyed by the content hash.
+    The cleaned frame is pickled under data/.cache/ so a restarted server
+    skips Excel parsing; older pickles of the same dataset are removed.
+    Set DASHBOARD_INGEST_CACHE=0 to neither read nor write the pickle.
+    """
+    content_hash = file_hash(file_path)
+    version = f"{Path(file_path).stem}-{content_hash[:12]}"
+    report_path = QUALITY_DIR / f"{version}.json"
+    # The frame depends on the cleaning code, Age on the current year, and pickles on the pandas version.
+    frame_path = CACHE_DIR / f"{version}-clean{CLEANING_VERSION}-{datetime.date.today().year}-pandas{pd.__version__}.pkl"
+
+    use_cache = os.environ.get("DASHBOARD_INGEST_CACHE", "1") != "0"
+    report = _read_report(report_path)
+    if use_cache and frame_path.exists() and report is not None:
+        df, sheet_names = pd.read_pickle(frame_path)
+        return df, sheet_names, report
+
+    sheets = read_sheets(file_path)
+    df, sheet_names = combine_sheets(sheets)
+
+    if report is None:
+        report = {
+            "version": QUALITY_REPORT_VERSION,
+            "file": Path(file_path).name,
+            "hash": content_hash,
+            "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+            "rows": len(df),
+            "columns": df.shape[1],
+            "sheets": sheet_names,
+            "duplicate_columns": list(dict.fromkeys(
+                col for frame in sheets.values() for col in duplicate_columns(frame.columns)
+            )),
+            "column_report": sheet_quality_report(sheets).to_dict(orient="records"),
+        }
+        _store(report_path, lambda path: path.write_text(json.dumps(report, indent=1, default=str)))
+    del sheets
+
+    df = clean_dataset(df)
+    if use_cache:
+        _store(frame_path, lambda path: pd.to_pickle((df, sheet_names), path))
+        _prune_frames(Path(file_path).stem, keep=frame_path)
+    return df, sheet_names, report
+
+def _read_report(path):
+    # Reports written by an older QUALITY_REPORT_VERSION are rebuilt.
+    if not path.exists():
+        return None
+    report = json.loads(path.read_text())
+    return report if report.get("version") == QUALITY_REPORT_VERSION else None
+
+def _store(path, write):
+    try:
+        path.parent.mkdir(exist_ok=True)
+        # Write then rename, so a concurrent reader never sees a partial file.
+        tmp_path = path.with_name(path.name + ".tmp")
+        write(tmp_path)
+        tmp_path.replace(path)
+    except OSError:
+        pass  # read-only data dir: the in-memory cache still holds the result
+
+def _prune_frames(stem, keep):
+    # Pickles of older file, cleaning, year or pandas versions are never read again.
+    stale = re.compile(re.escape(stem) + r"-[0-9a-f]{12}(-clean\d+)?-\d{4}-pandas.+\.pkl")
+    for path in CACHE_DIR.glob(f"{stem}-*.pkl"):
+        if path != keep and stale.fullmatch(path.name):
+            path.unlink(missing_ok=True)
+
+def _load_selection(selection):
+    file_path = DATASETS.get(selection)
+    if file_path is None:
+        return None
+    # The modification time is part of the cache key, so editing a file re-ingests it.
+    return load_dataset(file_path, file_path.stat().st_mtime_ns)
 
 def get_dataset_by_selection(selection):
-    if selection == "Individual Based Engagement":
-        return load_excel(DATA_DIR / "cleaned_new2_revised_2.xlsx")
-    elif selection == "Group Based Engagement":
-        return load_excel(DATA_DIR / "cleaned_Newdata01.xlsx")
-    else:
+    """
+    Return dataset and sheet names based on sidebar selection.
+    """
+    loaded = _load_selection(selection)
+    if loaded is None:
         return None, None
+    df, sheet_names, _ = loaded
+    return df, sheet_names
+
+def get_quality_report(selection):
+    """
+    Return the stored quality report for the selected dataset, or None.
+    """
+    loaded = _load_selection(selection)
+    return None if loaded is None else loaded[2]
+
+def week_numbers(weeks):
+    """
+    Return the integer week number for each 'Week_N' sheet label.
+    """
+    # Parse the handful of distinct sheet names once, not once per row.
+    codes, sheets = pd.factorize(weeks)
+    return pd.Series(sheets).str.extract(r"(\d+)", expand=False).astype(int).to_numpy()[codes]
+
+def login_counts(df, by=None):
+    """
+    Return, per student, how many 'Times Accessed' cells are above zero.
+
+    by: optional grouping keys aligned with df, instead of Student_ID.
+    """
+    login_cols = [col for col in df.columns if 'Times Accessed' in col]
+    return (df[login_cols] > 0).sum(axis=1).groupby(df['Student_ID'] if by is None else by).sum()
+
+def comparison_table(df_group, df_indiv):
+    """
+    Return scores and logins side by side for students in both datasets.
+    """
+    common = df_group['Student_ID'].drop_duplicates()
+    common = common[common.isin(df_indiv['Student_ID'])]
+    df_group = df_group[df_group['Student_ID'].isin(common)]
+    df_indiv = df_indiv[df_indiv['Student_ID'].isin(common)]
+
+    return pd.concat([
+        df_group.groupby('Student_ID')["Overall Result"].mean().rename("Group_Assignment_Score"),
+        df_indiv.groupby('Student_ID')["Overall Result"].mean().rename("Individual_Assignment_Score"),
+        login_counts(df_group).rename("Group_Logins"),
+        login_counts(df_indiv).rename("Individual_Logins"),
+    ], axis=1).dropna()
+
+def get_student_index(selection):
+    """
+    Return the selected dataset sorted by student then week, and an index
+    mapping each Student_ID (as a string) to its (start, stop) row slice.
+
+    Built once per dataset version and shared across sessions, so looking up
+    one student's timeline never scans the whole frame.
+    """
+    file_path = DATASETS.get(selection)
+    if file_path is None:
+        return None, {}
+    # Keyed on the modification time like load_dataset, so an edited file is re-indexed.
+    return _build_student_index(selection, file_path.stat().st_mtime_ns)
+
+@st.cache_resource(show_spinner=False, max_entries=len(DATASETS))
+def _build_student_index(selection, mtime_ns):
+    df, _ = get_dataset_by_selection(selection)
+    if df is None:
+        return None, {}
+
+    order = np.lexsort((week_numbers(df["Week"]), df["Student_ID"].to_numpy()))
+    df = df.iloc[order].reset_index(drop=True)
+
+    ids = df["Student_ID"].astype(str).to_numpy()
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    stops = np.r_[starts[1:], len(ids)]
+    return df, dict(zip(ids[starts], zip(starts.tolist(), stops.tolist())))
+
+def get_student_rows(df, index, student_id):
+    """
+    Return all rows for one student, or None if the ID is not in the index.
+    """
+    span = index.get(str(student_id).strip())
+    if span is None:
+        return None
+    return df.iloc[span[0]:span[1]]
@@ -0,0 +1,122 @@
+import streamlit as st
+
+# Page Setup
+st.set_page_config(page_title="Analytics Export", layout="wide")
+st.title("📦 Analytics Export")
+
+# Get Dataset Selection from Session State
+
+dataset_choice = st.session_state.get("selected_dataset")
+
+if not dataset_choice:
+    st.warning("Please select a dataset from the Home page.")
+    st.stop()
+
+st.sidebar.markdown(f"**📁 Selected Dataset:** {dataset_choice}")
+
+
+# Data Imports (deferred until the page skeleton is on screen)
+import datetime
+import sys, os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from my_utils import get_dataset_by_selection, get_quality_report
+from charts import line_spec
+from bundles import EXPORT_DIR, analytics_tables, write_bundle, zip_bundle, list_bundles, open_saved_bundle, open_uploaded_bundle
+
+
+# Load Datasets (both are needed for the comparison table)
+
+df, _ = get_dataset_by_selection(dataset_choice)
+df_group, _ = get_dataset_by_selection("Group Based Engagement")
+df_indiv, _ = get_dataset_by_selection("Individual Based Engagement")
+
+if df is None or df.empty:
+    st.error("❌ Failed to load the selected dataset.")
+    st.stop()
+
+report = get_quality_report(dataset_choice)
+source = {"dataset": dataset_choice, "file": report["file"], "hash": report["hash"]}
+
+
+# Export Analytics
+
+st.markdown("### 📤 Export Analytics")
+st.caption(
+    "Per-student totals, weekly trajectories, at-risk flags and the group vs individual "
+    "comparison, written table by table in row chunks."
+)
+
+fmt = st.radio("Format", ["parquet", "csv"], horizontal=True, format_func=str.upper)
+bundle_name = f"{dataset_choice.lower().replace(' ', '-')}-{report['hash'][:12]}"
+
+e1, e2 = st.columns(2)
+
+with e1:
+    if st.button("💾 Save bundle on server"):
+        stamp = f"{fmt}-{datetime.datetime.now():%Y%m%d-%H%M%S}"
+        with st.spinner("Writing bundle..."):
+            manifest = write_bundle(
+                analytics_tables(df, comparison=(df_group, df_indiv)),
+                EXPORT_DIR / f"{bundle_name}-{stamp}", fmt, source=source
+            )
+        st.success(f"Saved {len(manifest['tables'])} tables to exports/{bundle_name}-{stamp}")
+
+with e2:
+    # The bundle is only built when the button is clicked.
+    st.download_button(
+        "⬇️ Download bundle (.zip)",
+        data=lambda: zip_bundle(analytics_tables(df, comparison=(df_group, df_indiv)), fmt, source=source),
+        file_name=f"{bundle_name}-{fmt}.zip",
+        mime="application/zip",
+    )
+
+
+# Open an Exported Bundle
+
+st.markdown("### 📂 Open Exported Bundle")
+
+saved = list_bundles()
+b1, b2 = st.columns(2)
+with b1:
+    saved_choice = st.selectbox("Saved bundles", [""] + [path.name for path in saved])
+with b2:
+    uploaded = st.file_uploader("…or upload a bundle (.zip)", type="zip")
+
+if uploaded is not None:
+    try:
+        manifest, tables = open_uploaded_bundle(uploaded.file_id, uploaded)
+    except Exception as e:
+        st.error(f"❌ '{uploaded.name}' is not a readable analytics bundle: {e}")
+        st.stop()
+elif saved_choice:
+    bundle_dir = EXPORT_DIR / saved_choice
+    manifest, tables = open_saved_bundle(str(bundle_dir), bundle_dir.stat().st_mtime_ns)
+else:
+    st.info("Choose a saved bundle or upload one to browse it.")
+    st.stop()
+
+src = manifest.get("source", {})
+st.caption(
+    f"🗂 {src.get('dataset', 'Unknown dataset')} · version `{src.get('hash', '')[:12]}` · "
+    f"{manifest['format'].upper()} · created {manifest['created']} · read-only"
+)
+
+k1, k2, k3 = st.columns(3)
+k1.metric("📋 Tables", len(tables))
+if "student_totals" in tables:
+    k2.metric("👥 Students", len(tables["student_totals"]))
+if "risk_flags" in tables:
+    k3.metric("🚩 At-Risk Student-Weeks", int(tables["risk_flags"]["At_Risk"].sum()))
+
+    at_risk_by_week = tables["risk_flags"].groupby("Week_Num")["At_Risk"].sum()
+    fig_risk = line_spec(
+        at_risk_by_week.index, at_risk_by_week.values,
+        title="Students Flagged At Risk per Week",
+        x_title="Week", y_title="At-Risk Students", markers=True
+    )
+    st.plotly_chart(fig_risk, use_container_width=True)
+
+for tab, (name, table) in zip(st.tabs(list(tables)), tables.items()):
+    with tab:
+        st.dataframe(table, use_container_width=True, hide_index=True)
@@ -0,0 +1,73 @@
+import streamlit as st
+
+# Page Setup
+st.set_page_config(page_title="Data Quality", layout="wide")
+st.title("🧪 Data Quality Report")
+
+# Get Dataset Selection from Session State
+
+dataset_choice = st.session_state.get("selected_dataset")
+
+if not dataset_choice:
+    st.warning("Please select a dataset from the Home page.")
+    st.stop()
+
+st.sidebar.markdown(f"**📁 Selected Dataset:** {dataset_choice}")
+
+
+# Data Imports (deferred until the page skeleton is on screen)
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from my_utils import get_quality_report
+
+
+# Load Report (computed once at ingest)
+report = get_quality_report(dataset_choice)
+
+if report is None:
+    st.error("❌ Failed to load the selected dataset.")
+    st.stop()
+
+column_report = pd.DataFrame(report["column_report"])
+
+st.caption(f"📄 {report['file']} · version `{report['hash'][:12]}` · checked {report['generated']}")
+
+
+# Summary KPIs
+
+st.markdown("### 📌 Overview")
+k1, k2, k3, k4, k5 = st.columns(5)
+k1.metric("🧾 Rows", report["rows"])
+k2.metric("🗂 Columns", report["columns"])
+k3.metric("📅 Sheets", len(report["sheets"]))
+k4.metric("🕳 Null Cells", int(column_report["nulls"].sum()))
+k5.metric("📈 Outlier Cells", int(column_report["outliers"].sum()))
+
+
+# Duplicate Columns
+
+st.markdown("### 🧬 Duplicate Columns")
+if report["duplicate_columns"]:
+    st.warning("Columns duplicated in the source sheets (renamed with a numeric suffix on load):")
+    st.write(report["duplicate_columns"])
+else:
+    st.success("No duplicate columns found.")
+
+
+# Per-Column Checks
+
+st.markdown("### 🔍 Column Checks")
+only_issues = st.checkbox("Show only columns with issues", value=True)
+
+if only_issues:
+    checks = ["nulls", "whitespace", "special_chars", "outliers"]
+    column_report = column_report[column_report[checks].sum(axis=1) > 0]
+
+st.dataframe(column_report, use_container_width=True, hide_index=True)
+st.caption(
+    "Whitespace and special characters are counted on the raw text before ingest cleaning; "
+    "outliers are numeric cells outside the 1st–99th percentile of their column in that sheet. "
+    "Each column is only checked in the sheets that contain it."
+)
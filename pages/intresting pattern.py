@@ -1,14 +1,4 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import sys, os
-
-from scipy.stats import linregress
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from my_utils import get_dataset_by_selection
-
 
 #Page Setup
 
@@ -27,6 +17,16 @@ if not dataset_choice:
 st.sidebar.markdown(f"**📁 Selected Dataset:** {dataset_choice}")
 
 
+# Data Imports (deferred until the page skeleton is on screen)
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from my_utils import get_dataset_by_selection
+from charts import bar_spec, line_spec, histogram_spec, scatter_spec
+from risk import DEFAULT_RULES, DEFAULT_AT_RISK_MIN_RULES, get_risk_scores, risk_timeline, performance_bands
+
+
 # Load Dataset
 
 df, sheet_names = get_dataset_by_selection(dataset_choice)
@@ -67,14 +67,14 @@ if not student_access.empty:
     avg_access_trend = student_access.drop(columns='Student_ID').mean().reset_index()
     avg_access_trend.columns = ['Week_Transition', 'Average_Access']
 
-    fig_trend = px.line(
-        avg_access_trend,
-        x='Week_Transition',
-        y='Average_Access',
-        markers=True,
-        title='Average Student Access in the Next Week'
+    fig_trend = line_spec(
+        avg_access_trend['Week_Transition'],
+        avg_access_trend['Average_Access'],
+        title='Average Student Access in the Next Week',
+        x_title='Week Transition',
+        y_title='Average Access Count',
+        markers=True
     )
-    fig_trend.update_layout(xaxis_title='Week Transition', yaxis_title='Average Access Count')
     st.plotly_chart(fig_trend, use_container_width=True)
 
 
@@ -96,22 +96,24 @@ if not student_access.empty:
 
     # Top 5 Proactive Students 
     st.subheader("🔝 Top 5 Proactive Students")
-    fig_top, ax_top = plt.subplots(figsize=(4, 3)) 
-    ax_top.bar(top_5['Student_ID'].astype(str), top_5['Total_Next_Week_Access'], color='green')
-    ax_top.set_ylabel("Next-Week Access Count")
-    ax_top.set_xlabel("Student ID")
-    ax_top.set_title("Top 5 Most Proactive Students")
-    st.pyplot(fig_top)
+    fig_top = bar_spec(
+        top_5['Student_ID'].astype(str), top_5['Total_Next_Week_Access'],
+        title="Top 5 Most Proactive Students",
+        x_title="Student ID", y_title="Next-Week Access Count",
+        color='green', xaxis_type='category'
+    )
+    st.plotly_chart(fig_top, use_container_width=True)
 
 
     # Bottom 5 Least Proactive Students 
     st.subheader("🔻 Bottom 5 Least Proactive Students")
-    fig_bot, ax_bot = plt.subplots()
-    ax_bot.bar(bottom_5['Student_ID'].astype(str), bottom_5['Total_Next_Week_Access'], color='red')
-    ax_bot.set_ylabel("Next-Week Access Count")
-    ax_bot.set_xlabel("Student ID")
-    ax_bot.set_title("Bottom 5 Least Proactive Students")
-    st.pyplot(fig_bot)
+    fig_bot = bar_spec(
+        bottom_5['Student_ID'].astype(str), bottom_5['Total_Next_Week_Access'],
+        title="Bottom 5 Least Proactive Students",
+        x_title="Student ID", y_title="Next-Week Access Count",
+        color='red', xaxis_type='category'
+    )
+    st.plotly_chart(fig_bot, use_container_width=True)
 
     # Access vs Marks Table 
     st.subheader("📊 Access vs Marks")
@@ -125,45 +127,79 @@ else:
     st.info("Next-week access data is not available in the dataset.")
 
 
-if 'Week_1' in sheet_names:
-    df_w1 = df[df['Week'] == 'Week_1'].copy()
+# At-Risk Students by Week
 
-    week_cols = [col for col in df_w1.columns if 'Time_accessed_week' in col]
-    early_cols = [col for col in week_cols if any(str(w) in col for w in [1, 2, 3])]
+st.subheader("🚩 At-Risk Students by Week")
 
-    if early_cols and 'Overall Result' in df_w1.columns:
-        # Compute engagement metrics
-        df_w1['Engagement_Slope'] = df_w1[week_cols].apply(
-            lambda row: linregress(range(1, len(week_cols)+1), row)[0], axis=1
-        )
-        df_w1['Engagement_Variance'] = df_w1[week_cols].std(axis=1)
-        df_w1['Early_Engagement_Avg'] = df_w1[early_cols].mean(axis=1)
-
-        # Identify at-risk students
-        df_w1['At_Risk'] = (df_w1['Early_Engagement_Avg'] < 2) & (df_w1['Overall Result'] < 40)
-
-        output_df = df_w1[['Student_ID', 'Early_Engagement_Avg', 'Overall Result', 'At_Risk']].dropna()
-
-        # Histogram of Early Engagement
-        fig_hist = px.histogram(
-            output_df,
-            x='Early_Engagement_Avg',
-            nbins=20,
-            color='At_Risk',
-            barmode='overlay',
-            color_discrete_map={True: 'red', False: 'green'},
-            title='Early Engagement Distribution (Weeks 1–3)'
+with st.expander("⚙️ At-risk rules"):
+    rules = []
+    for rule in DEFAULT_RULES:
+        value = st.number_input(
+            f"{rule['name']}: {rule['metric']} {rule['op']}",
+            value=float(rule['value']),
+            step=0.05 if abs(rule['value']) < 5 else 1.0,
+            key=f"risk_rule_{rule['name']}"
         )
-        st.plotly_chart(fig_hist, use_container_width=True)
-
-     
-        st.warning("Required columns for this analysis are missing.")
-else:
-    st.warning("Week_1 data not available in the dataset.")
-
-
-
+        rules.append({**rule, 'value': value})
+    at_risk_min_rules = st.slider(
+        "Rules triggered to flag a student as at risk",
+        min_value=1, max_value=len(rules), value=DEFAULT_AT_RISK_MIN_RULES
+    )
 
+# Scored once per dataset version and rule set, not on every widget change
+scored = get_risk_scores(dataset_choice, rules, at_risk_min_rules=at_risk_min_rules)
+
+# At-risk count per week
+at_risk_by_week = scored.groupby('Week_Num')['At_Risk'].sum()
+fig_risk = line_spec(
+    at_risk_by_week.index,
+    at_risk_by_week.values,
+    title='Students Flagged At Risk per Week',
+    x_title='Week',
+    y_title='At-Risk Students',
+    markers=True
+)
+st.plotly_chart(fig_risk, use_container_width=True)
+
+# Weekly activity distribution for one week
+week_num = st.selectbox("📅 Week", sorted(scored['Week_Num'].unique()), format_func=lambda w: f"Week_{w}")
+week_scored = scored[scored['Week_Num'] == week_num]
+fig_hist = histogram_spec(
+    week_scored['Weekly_Hours'],
+    nbins=20,
+    groups=week_scored['At_Risk'],
+    colors={True: 'red', False: 'green'},
+    title=f'Weekly Activity Distribution (Week {week_num})',
+    x_title='Weekly Activity (hours)'
+)
+st.plotly_chart(fig_hist, use_container_width=True)
+
+# Week-to-week risk status for students flagged at least once
+timeline = risk_timeline(scored)
+flagged = timeline[(timeline == 'At Risk').any(axis=1)]
+st.markdown(f"**{len(flagged)}** students were flagged at risk in at least one week.")
+st.dataframe(flagged.rename(columns=lambda w: f"Week_{w}"))
+
+student_id = st.selectbox("🎓 Student risk history", timeline.index)
+student_scored = scored[scored['Student_ID'] == student_id]
+
+# Students sharing an ID have separate records; plot one at a time
+records = student_scored['Record'].unique()
+if len(records) > 1:
+    st.warning(f"⚠️ Student ID '{student_id}' is shared by {len(records)} students; choose which one to show.")
+    record = st.radio("Record", records, horizontal=True, format_func=lambda r: f"Student {r + 1}")
+    student_scored = student_scored[student_scored['Record'] == record]
+
+fig_student = line_spec(
+    student_scored['Week_Num'],
+    student_scored['Risk_Score'],
+    title=f'Rules Triggered per Week – Student {student_id}',
+    x_title='Week',
+    y_title='Rules Triggered',
+    markers=True
+)
+st.plotly_chart(fig_student, use_container_width=True)
+st.dataframe(student_scored[['Week', 'Weekly_Hours', 'Hours_Trend'] + [r['name'] for r in rules] + ['Risk_Level']])
 
 
 # Early Engagement vs Performance (Binned View)
@@ -178,7 +214,6 @@ if 'Week_1' in sheet_names:
 
     if early_cols and 'Overall Result' in df_w1.columns:
         df_w1['Early_Engagement_Avg'] = df_w1[early_cols].mean(axis=1)
-        df_w1['At_Risk'] = (df_w1['Early_Engagement_Avg'] < 2) & (df_w1['Overall Result'] < 40)
 
         # Bin early engagement into ranges
         bins = [0, 0.5, 1, 1.5, 2, 2.5, 3, 3.5, 5]
@@ -186,22 +221,18 @@ if 'Week_1' in sheet_names:
         df_w1['Engagement_Bin'] = pd.cut(df_w1['Early_Engagement_Avg'], bins=bins, labels=labels, right=False)
 
         # Group and aggregate
-        grouped = df_w1.groupby('Engagement_Bin').agg(
-            Avg_Result=('Overall Result', 'mean'),
-            At_Risk_Count=('At_Risk', 'sum'),
-            Total=('At_Risk', 'count')
+        grouped = df_w1.groupby('Engagement_Bin', observed=False).agg(
+            Avg_Result=('Overall Result', 'mean')
         ).reset_index()
 
-        grouped['At_Risk_Percent'] = (grouped['At_Risk_Count'] / grouped['Total']) * 100
-
         # Plot bar chart: Avg Result per engagement bin
-        fig_bar = px.bar(
-            grouped,
-            x='Engagement_Bin',
-            y='Avg_Result',
-            text='Avg_Result',
+        fig_bar = bar_spec(
+            grouped['Engagement_Bin'].astype(str),
+            grouped['Avg_Result'],
             title='📊 Average Result by Early Engagement Level',
-            labels={'Engagement_Bin': 'Early Engagement (Weeks 1–3)', 'Avg_Result': 'Average Result (%)'}
+            x_title='Early Engagement (Weeks 1–3)',
+            y_title='Average Result (%)',
+            text=True
         )
         st.plotly_chart(fig_bar, use_container_width=True)
 
@@ -227,17 +258,7 @@ if 'Overall Result' in df_w1.columns and week_cols:
     df_w1['Total_Access_Time'] = df_w1[week_cols].sum(axis=1)
 
     # Categorize performance bands
-    def categorize(score):
-        if score >= 70:
-            return 'Distinction'
-        elif score >= 60:
-            return 'Merit'
-        elif score >= 50:
-            return 'Pass'
-        else:
-            return 'Fail'
-
-    df_w1['Performance_Band'] = df_w1['Overall Result'].apply(categorize)
+    df_w1['Performance_Band'] = performance_bands(df_w1['Overall Result'])
 
     if 'Student_ID' in df_w1.columns:
         df_w1['Student_ID'] = df_w1['Student_ID'].astype(str)
@@ -245,29 +266,25 @@ if 'Overall Result' in df_w1.columns and week_cols:
         df_w1['Student_ID'] = df_w1.index.astype(str) 
 
     # catterplot using Plotly
-    fig_perf = px.scatter(
-        df_w1,
-        x='Total_Access_Time',
-        y='Overall Result',
-        color='Performance_Band',
-        hover_name='Student_ID',
-        title='Total Engagement Time vs Overall Performance',
-        labels={
-            'Total_Access_Time': 'Total Engagement Time (All Weeks)',
-            'Overall Result': 'Final Result (%)',
-            'Performance_Band': 'Performance Category'
-        },
-        color_discrete_map={
+    fig_perf = scatter_spec(
+        df_w1['Total_Access_Time'],
+        df_w1['Overall Result'],
+        groups=df_w1['Performance_Band'],
+        hover=df_w1['Student_ID'],
+        colors={
             'Distinction': 'blue',
             'Merit': 'green',
             'Pass': 'orange',
             'Fail': 'red'
         },
+        title='Total Engagement Time vs Overall Performance',
+        x_title='Total Engagement Time (All Weeks)',
+        y_title='Final Result (%)',
+        legend_title='Performance Category',
+        marker=dict(size=10, line=dict(width=0.5, color='DarkSlateGrey')),
+        title_x=0.5
     )
 
-    fig_perf.update_traces(marker=dict(size=10, line=dict(width=0.5, color='DarkSlateGrey')))
-    fig_perf.update_layout(title_x=0.5)
-
     st.plotly_chart(fig_perf, use_container_width=True)
 
 else:
@@ -309,17 +326,13 @@ try:
         window_counts = long_df['2-Hour Window'].value_counts().sort_index()
 
         # Plot
-        import plotly.graph_objects as go
-        fig_time = go.Figure(go.Bar(
-            x=window_counts.index,
-            y=window_counts.values,
-            marker_color='steelblue'
-        ))
-
-        fig_time.update_layout(
+        fig_time = bar_spec(
+            window_counts.index.astype(str),
+            window_counts.values,
             title="Login Frequency by 2-Hour Time Windows",
-            xaxis_title="Time Window",
-            yaxis_title="Number of Logins",
+            x_title="Time Window",
+            y_title="Number of Logins",
+            color='steelblue',
             xaxis_tickangle=-45,
             template="simple_white",
             title_x=0.5
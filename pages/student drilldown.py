@@ -0,0 +1,101 @@
+import streamlit as st
+
+# Page Setup
+st.set_page_config(page_title="Student Drill-Down", layout="wide")
+st.title("🧑‍🎓 Student Drill-Down")
+
+# Get Dataset Selection from Session State
+
+dataset_choice = st.session_state.get("selected_dataset")
+
+if not dataset_choice:
+    st.warning("Please select a dataset from the Home page.")
+    st.stop()
+
+st.sidebar.markdown(f"**📁 Selected Dataset:** {dataset_choice}")
+
+
+# Data Imports (deferred until the page skeleton is on screen)
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from my_utils import DAY_COLUMNS, get_student_index, get_student_rows
+from charts import line_spec
+
+
+# Load Dataset and Student Index (built once per dataset)
+df, student_index = get_student_index(dataset_choice)
+
+if df is None or df.empty:
+    st.error("❌ Failed to load the selected dataset.")
+    st.stop()
+
+
+# Student Lookup
+
+student_id = st.text_input("🔎 Student ID", placeholder=f"{len(student_index)} students in this dataset")
+
+if not student_id:
+    st.info("Enter a Student ID to see their weekly timeline.")
+    st.stop()
+
+student_df = get_student_rows(df, student_index, student_id)
+
+if student_df is None:
+    st.error(f"❌ Student ID '{student_id}' not found in this dataset.")
+    st.stop()
+
+student_df = student_df.set_index("Week")
+
+if student_df.index.duplicated().any():
+    st.warning(f"⚠️ Student ID '{student_id}' is shared by more than one record; all are shown.")
+
+
+# Column Setup
+
+score_cols = ["CW2", "CW3", "CW4", "CC1 [FA] (100)", "Overall Result"]
+day_columns = [col for col in DAY_COLUMNS if col in df.columns]
+access_cols = [col for col in df.columns if "times accessed" in col.lower() or "time_accessed" in col.lower()]
+initial_access_cols = [col for col in df.columns if col.lower().startswith("initial")]
+
+
+# Marks
+
+st.markdown("### 📝 Marks")
+marks = student_df[[col for col in score_cols if col in student_df.columns]].iloc[0]
+for col, (name, value) in zip(st.columns(len(marks)), marks.items()):
+    col.metric(name, "N/A" if pd.isna(value) else f"{value:g}")
+
+
+# Daily Activity by Week
+
+st.markdown("### 📊 Daily Activity by Week")
+if day_columns:
+    daily_df = student_df[day_columns].rename(columns={day_columns[0]: "Monday"})
+    weekly_hours = daily_df.sum(axis=1)
+    fig_hours = line_spec(weekly_hours.index, weekly_hours.values, x_title="Week", y_title="Hours", markers=True)
+    st.plotly_chart(fig_hours, use_container_width=True)
+    st.dataframe(daily_df)
+else:
+    st.info("No daily activity data in this dataset.")
+
+
+# Access Counts by Week
+
+st.markdown("### 🔁 Access Counts")
+access_df = student_df[access_cols].dropna(axis=1, how="all")
+if not access_df.empty:
+    st.dataframe(access_df)
+else:
+    st.info("No access count data for this student.")
+
+
+# Initial Access Timestamps
+
+st.markdown("### ⏩ Initial Access")
+initial_df = student_df[initial_access_cols].dropna(axis=1, how="all")
+if not initial_df.empty:
+    st.dataframe(initial_df.astype(str).replace({"nan": "", "NaT": "", "None": ""}))
+else:
+    st.info("No initial access data for this student.")
@@ -1,12 +1,4 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import sys, os
-
-# Import get_dataset_by_selection from utils.py
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from my_utils import get_dataset_by_selection
-
 
 # Page Setup
 st.set_page_config(page_title="Student Engagement", layout="wide")
@@ -23,6 +15,15 @@ if not dataset_choice:
 st.sidebar.markdown(f"**📁 Selected Dataset:** {dataset_choice}")
 
 
+# Data Imports (deferred until the page skeleton is on screen)
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from my_utils import DAY_COLUMNS, get_dataset_by_selection
+from charts import bar_spec, line_spec
+
+
 #Load Dataset from utils
 df, sheet_names = get_dataset_by_selection(dataset_choice)
 
@@ -43,10 +44,7 @@ if week_selection != "All Weeks":
 
 gender_col = "Q10 How do you describe yourself? - Selected Choice"
 country_col = "Q12 List of Countries"
-day_columns = [
-    "Student Activity by Day in hours Monday", "Tuesday", "Wednesday", "Thursday",
-    "Friday", "Saturday", "Sunday"
-]
+day_columns = DAY_COLUMNS
 resource_columns = ["Learning_Materials_Time", "Module_Info_Time", "Reading_List_Time"]
 initial_access_cols = [col for col in df.columns if col.startswith("Initial_Week_")]
 
@@ -82,7 +80,7 @@ a3.metric("📖 Reading Time", f"{total_reading_time:.1f} hrs")
 st.markdown("### 📊 Student Activity by Day")
 avg_by_day = df[day_columns].mean().reset_index()
 avg_by_day.columns = ["Day", "Avg Hours"]
-fig_day = px.line(avg_by_day, x="Day", y="Avg Hours", markers=True)
+fig_day = line_spec(avg_by_day["Day"], avg_by_day["Avg Hours"], x_title="Day", y_title="Avg Hours", markers=True)
 st.plotly_chart(fig_day, use_container_width=True)
 
 
@@ -91,7 +89,7 @@ st.plotly_chart(fig_day, use_container_width=True)
 st.markdown("### 🧠 Time Spent on Content Types")
 resource_df = df[resource_columns].mean().reset_index()
 resource_df.columns = ["Content Type", "Avg Hours"]
-fig_resource = px.bar(resource_df, x="Content Type", y="Avg Hours", text_auto=True)
+fig_resource = bar_spec(resource_df["Content Type"], resource_df["Avg Hours"], x_title="Content Type", y_title="Avg Hours", text=True)
 st.plotly_chart(fig_resource, use_container_width=True)
 
 
@@ -103,7 +101,7 @@ if initial_access_cols:
     access_df.columns = ["Week", "Access Count"]
     access_df["Week"] = access_df["Week"].str.extract(r"(\d+)").astype(int)
     access_df = access_df.sort_values("Week")
-    fig_early = px.area(access_df, x="Week", y="Access Count")
+    fig_early = line_spec(access_df["Week"], access_df["Access Count"], x_title="Week", y_title="Access Count", fill=True)
     st.plotly_chart(fig_early, use_container_width=True)
 else:
     st.info("No early access data available.")
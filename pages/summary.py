@@ -1,12 +1,4 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import datetime
-import sys, os
-
-# ✅ Add utils path BEFORE importing
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from my_utils import get_dataset_by_selection
 
 # -------------------------
 # ✅ Page Setup
@@ -25,11 +17,21 @@ if not dataset_choice:
 
 st.sidebar.markdown(f"**📁 Selected Dataset:** {dataset_choice}")
 
+# -------------------------
+# 📦 Data Imports (deferred until the page skeleton is on screen)
+# -------------------------
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from my_utils import get_dataset_by_selection
+from charts import pie_spec, histogram_spec
+
 # -------------------------
 # 📁 Load Dataset from utils
 # -------------------------
 full_df, sheet_names = get_dataset_by_selection(dataset_choice)  # ✅ Keep unfiltered original
-df = full_df.copy()  # ✅ Working copy
+df = full_df  # ✅ Filtered below, never modified in place
 
 if df is None or df.empty:
     st.error("❌ Failed to load the selected dataset.")
@@ -43,7 +45,6 @@ st.success(f"📊 Currently using: **{dataset_choice}**")
 gender_col = "Q10 How do you describe yourself? - Selected Choice"
 country_col = "Q12 List of Countries"
 degree_col = "Q16 What is your first degree subject area?"
-age_col = "Q14 What is your year of birth (Just the year, e.g. 1995) ?"
 score_cols = ["CW2", "CW3", "CW4", "CC1 [FA] (100)"]
 student_id_col = "StudentID"  # 🔁 Replace with your actual student ID column if needed
 
@@ -57,16 +58,9 @@ if week_selection != "All Weeks":
     df = df[df["Week"] == week_selection]
 
 # -------------------------
-# 🧽 Clean Data
+# 🧽 Age Filter (text and Age are cleaned at ingest)
 # -------------------------
-for col in [gender_col, country_col, degree_col, age_col]:
-    if col in df.columns:
-        df[col] = df[col].astype(str).str.strip()
-
-current_year = datetime.datetime.now().year
-df["Age"] = pd.to_numeric(df[age_col], errors='coerce')
-df["Age"] = current_year - df["Age"]
-df = df[df["Age"].between(18, 100)]
+df = df[df["Age"].notna()]
 
 # -------------------------
 # 🔍 Filters (Gender, Country)
@@ -93,18 +87,7 @@ k1, k2, k3, k4 = st.columns(4)
 with k1:
     if week_selection == "All Weeks":
         # Use Week_1 from full_df
-        week1_df = full_df[full_df["Week"] == "Week_1"]
-
-        # Clean and process Week 1 data
-        for col in [gender_col, country_col, degree_col, age_col]:
-            if col in week1_df.columns:
-                week1_df[col] = week1_df[col].astype(str).str.strip()
-
-        # ✅ Age filtering
-        current_year = datetime.datetime.now().year
-        week1_df["Age"] = pd.to_numeric(week1_df[age_col], errors='coerce')
-        week1_df["Age"] = current_year - week1_df["Age"]
-        week1_df = week1_df[week1_df["Age"].between(18, 100)]
+        week1_df = full_df[(full_df["Week"] == "Week_1") & full_df["Age"].notna()]
 
         # Apply filters
         if gender_filter != "All":
@@ -161,7 +144,7 @@ with c1:
     st.markdown("#### 🎓 Top 5 Degree Subjects")
     if degree_col in df.columns:
         top_degrees = df[degree_col].value_counts().nlargest(5)
-        fig_degrees = px.pie(values=top_degrees.values, names=top_degrees.index, hole=0.5)
+        fig_degrees = pie_spec(top_degrees.values, top_degrees.index, hole=0.5)
         st.plotly_chart(fig_degrees, use_container_width=True)
     else:
         st.warning("Degree subject data not available.")
@@ -170,7 +153,7 @@ with c2:
     st.markdown("#### 🚻 Gender Distribution")
     if gender_col in df.columns:
         gender_counts = df[gender_col].value_counts()
-        fig_gender = px.pie(values=gender_counts.values, names=gender_counts.index, hole=0.5)
+        fig_gender = pie_spec(gender_counts.values, gender_counts.index, hole=0.5)
         st.plotly_chart(fig_gender, use_container_width=True)
     else:
         st.warning("Gender data not available.")
@@ -180,7 +163,7 @@ with c3:
     st.markdown("#### 🌍 Top 5 Countries")
     if country_col in df.columns:
         top_countries = df[country_col].value_counts().nlargest(5)
-        fig_country = px.pie(values=top_countries.values, names=top_countries.index, hole=0.5)
+        fig_country = pie_spec(top_countries.values, top_countries.index, hole=0.5)
         st.plotly_chart(fig_country, use_container_width=True)
     else:
         st.warning("Country data not available.")
@@ -188,8 +171,7 @@ with c3:
 with c4:
     st.markdown("#### 👶 Age Distribution")
     if "Age" in df.columns:
-        fig_age = px.histogram(df, x="Age", nbins=10, title="Age Histogram")
-        fig_age.update_layout(xaxis_title="Age", yaxis_title="Count", bargap=0.1)
+        fig_age = histogram_spec(df["Age"], nbins=10, title="Age Histogram", x_title="Age", y_title="Count", bargap=0.1)
         st.plotly_chart(fig_age, use_container_width=True)
     else:
         st.warning("Age data not available.")
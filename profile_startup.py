@@ -0,0 +1,131 @@
+"""
+Profile dashboard cold start, one fresh Python process per measurement.
+
+    python profile_startup.py                      # all pages, default dataset
+    python profile_startup.py --top 8              # show 8 slowest imports per page
+    python profile_startup.py --root ../old-checkout --dataset "Individual Based Engagement"
+
+For every page it reports:
+- imports: cost of the page's module-level import statements (-X importtime),
+  with the slowest top-level packages. streamlit itself is listed but not
+  counted, since the server process has already imported it;
+- first paint: time until the page's st.title() call, i.e. when the skeleton
+  appears;
+- first render: time for the whole first run, including loading the dataset.
+
+The ingest cache under data/.cache/ is ignored unless --warm is given, so
+the numbers match a container that has just been rebuilt.
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+_RENDER_SCRIPT = """
+import json, sys, time
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+paint = []
+_title = st.title
+def title(*args, **kwargs):
+    paint.append(time.perf_counter())
+    return _title(*args, **kwargs)
+st.title = title
+
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.session_state["selected_dataset"] = sys.argv[2]
+t0 = time.perf_counter()
+at.run()
+done = time.perf_counter()
+print(json.dumps({
+    "first_paint": (paint[0] - t0) if paint else None,
+    "first_render": done - t0,
+    "errors": [str(e.value) for e in at.exception],
+}))
+"""
+
+
+def import_block(page_path):
+    """
+    Return the page's module-level import statements as source code.
+    """
+    tree = ast.parse(Path(page_path).read_text(encoding="utf-8"))
+    stmts = [
+        node for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        or (isinstance(node, ast.Expr) and "sys.path" in ast.unparse(node))
+    ]
+    return "\n".join(ast.unparse(node).replace("__file__", repr(str(page_path))) for node in stmts)
+
+
+def _import_times(code, cwd=None):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, capture_output=True, text=True
+    )
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level packages are the unindented entries.
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            packages[name.strip()] = int(cumulative) / 1e6
+    return packages
+
+
+def profile_imports(page_path, top=5):
+    """
+    Return (total seconds, [(package, seconds), ...]) for a page's imports.
+    """
+    packages = _import_times(import_block(page_path), cwd=Path(page_path).parent)
+    # Drop what the interpreter imports before running any code (site, encodings, ...).
+    for name in _import_times("pass"):
+        packages.pop(name, None)
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    total = sum(secs for name, secs in packages.items() if name != "streamlit")
+    return total, slowest[:top]
+
+
+def profile_render(page_path, dataset):
+    """
+    Return first-paint and first-render timings for a page in a fresh process.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _RENDER_SCRIPT, str(page_path), dataset],
+        cwd=Path(page_path).parent.parent, capture_output=True, text=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default=BASE_DIR, type=Path, help="checkout to profile")
+    parser.add_argument("--dataset", default="Group Based Engagement")
+    parser.add_argument("--top", default=5, type=int, help="slowest imports to list per page")
+    parser.add_argument("--warm", action="store_true", help="allow the on-disk ingest cache")
+    args = parser.parse_args()
+
+    if not args.warm:
+        os.environ["DASHBOARD_INGEST_CACHE"] = "0"
+
+    pages = sorted((args.root / "pages").glob("*.py"))
+    print(f"{'page':28s} {'imports':>9s} {'first paint':>12s} {'first render':>13s}")
+    for page in pages:
+        total, slowest = profile_imports(page, args.top)
+        render = profile_render(page, args.dataset)
+        paint = "n/a" if render["first_paint"] is None else f"{render['first_paint'] * 1000:.0f} ms"
+        print(f"{page.name:28s} {total * 1000:6.0f} ms {paint:>12s} {render['first_render'] * 1000:10.0f} ms")
+        print("    " + ", ".join(f"{name} {secs * 1000:.0f} ms" for name, secs in slowest))
+        for error in render["errors"]:
+            print(f"    error: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import operator
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from my_utils import DATASETS, DAY_COLUMNS, get_dataset_by_selection, week_numbers
+
+
+# Each rule flags a student-week when `metric <op> value` holds.
+# Metrics come from weekly_metrics(); any numeric dataset column works too.
+DEFAULT_RULES = [
+    {"name": "Low weekly activity", "metric": "Weekly_Hours", "op": "<", "value": 0.5},
+    {"name": "Falling activity", "metric": "Hours_Trend", "op": "<", "value": -0.25},
+    {"name": "Failing result", "metric": "Overall Result", "op": "<", "value": 40},
+]
+
+# Lower bound (inclusive) of each performance band on Overall Result.
+DEFAULT_BANDS = {"Fail": 0, "Pass": 50, "Merit": 60, "Distinction": 70}
+
+# Number of triggered rules at which a student-week is flagged at risk.
+DEFAULT_AT_RISK_MIN_RULES = 2
+
+RISK_LEVELS = ["On Track", "Watch", "At Risk"]
+
+_OPS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+}
+
+
+def performance_bands(scores, bands=None):
+    """
+    Map scores to performance band labels using lower cut-offs.
+
+    Missing scores fall in the lowest band, as they always have on the
+    patterns page.
+    """
+    bands = sorted((bands or DEFAULT_BANDS).items(), key=lambda item: item[1])
+    labels = [name for name, _ in bands]
+    edges = [-np.inf] + [cut for _, cut in bands[1:]] + [np.inf]
+    return pd.cut(scores, bins=edges, labels=labels, right=False).fillna(labels[0])
+
+
+def student_records(df, week_col="Week"):
+    """
+    Number the rows that share a Student_ID in the same week (0, 1, ...).
+
+    A few IDs are shared by more than one student; (Student_ID, record)
+    tells them apart and is 0 for every other student.
+    """
+    return df.groupby(["Student_ID", week_col], sort=False).cumcount()
+
+
+def weekly_metrics(df, columns=()):
+    """
+    Return one row per student per week with the metrics the rules use.
+
+    columns: extra dataset columns to carry through (e.g. for custom rules).
+
+    Weekly_Hours is the sum of the daily activity columns, Cumulative_Hours
+    the running total, and Hours_Trend the change against the student's mean
+    over all earlier weeks (0 in their first week). Record is
+    student_records(), so students sharing an ID keep separate histories.
+    """
+    day_cols = [col for col in DAY_COLUMNS if col in df.columns]
+    extra = ["Overall Result", *columns]
+    keep = ["Student_ID", "Week"] + [col for col in dict.fromkeys(extra) if col in df.columns]
+
+    out = df[keep].copy()
+    out["Week_Num"] = week_numbers(out["Week"])
+    out["Weekly_Hours"] = np.nansum(df[day_cols].to_numpy(dtype=float), axis=1)
+    out["Record"] = student_records(out, "Week_Num")
+    out = out.sort_values(["Student_ID", "Record", "Week_Num"], kind="stable").reset_index(drop=True)
+
+    by_student = out.groupby(["Student_ID", "Record"], sort=False)["Weekly_Hours"]
+    out["Cumulative_Hours"] = by_student.cumsum()
+    prior_weeks = by_student.cumcount()
+    prior_mean = (out["Cumulative_Hours"] - out["Weekly_Hours"]) / prior_weeks.replace(0, np.nan)
+    out["Hours_Trend"] = (out["Weekly_Hours"] - prior_mean).fillna(0)
+    return out
+
+
+def score_risk(df, rules=None, bands=None, at_risk_min_rules=DEFAULT_AT_RISK_MIN_RULES):
+    """
+    Score every student in every week against the configured rules.
+
+    Returns the weekly_metrics() frame with one boolean column per rule,
+    Risk_Score (number of rules triggered), Risk_Level, At_Risk and
+    Performance_Band.
+    """
+    rules = DEFAULT_RULES if rules is None else rules
+    scored = weekly_metrics(df, columns=[rule["metric"] for rule in rules])
+
+    flags = np.zeros((len(scored), len(rules)), dtype=bool)
+    for i, rule in enumerate(rules):
+        if rule["metric"] not in scored.columns:
+            raise KeyError(f"Unknown metric for rule '{rule['name']}': {rule['metric']}")
+        values = pd.to_numeric(scored[rule["metric"]], errors="coerce").to_numpy(dtype=float)
+        flags[:, i] = _OPS[rule["op"]](values, rule["value"])
+        scored[rule["name"]] = flags[:, i]
+
+    scored["Risk_Score"] = flags.sum(axis=1)
+    scored["At_Risk"] = scored["Risk_Score"] >= at_risk_min_rules
+    scored["Risk_Level"] = pd.Categorical.from_codes(
+        np.select([scored["At_Risk"], scored["Risk_Score"] > 0], [2, 1], default=0),
+        categories=RISK_LEVELS, ordered=True
+    )
+    if "Overall Result" in scored.columns:
+        scored["Performance_Band"] = performance_bands(scored["Overall Result"], bands)
+    return scored
+
+
+def get_risk_scores(selection, rules=None, at_risk_min_rules=DEFAULT_AT_RISK_MIN_RULES):
+    """
+    Return score_risk() for the selected dataset, computed once per dataset
+    version and rule set, or None if the selection is unknown.
+    """
+    file_path = DATASETS.get(selection)
+    if file_path is None:
+        return None
+    rules = DEFAULT_RULES if rules is None else rules
+    frozen_rules = tuple(tuple(rule.items()) for rule in rules)
+    return _score_dataset(selection, file_path.stat().st_mtime_ns, frozen_rules, at_risk_min_rules)
+
+
+@st.cache_data(show_spinner="Scoring students...", max_entries=16)
+def _score_dataset(selection, mtime_ns, rules, at_risk_min_rules):
+    df, _ = get_dataset_by_selection(selection)
+    return score_risk(df, [dict(rule) for rule in rules], at_risk_min_rules=at_risk_min_rules)
+
+
+def risk_timeline(scored, value="Risk_Level"):
+    """
+    Pivot scored rows to one row per student and one column per week.
+
+    Students sharing an ID are reported at their highest value that week.
+    """
+    return scored.groupby(["Student_ID", "Week_Num"], observed=True)[value].max().unstack("Week_Num")